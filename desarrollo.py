@@ -1,36 +1,146 @@
-from enum import Enum
-from dataclasses import dataclass
-from typing import List
+from enum import IntEnum
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
+from array import array
+
+# Criterios SMART empaquetados como bits de Requirement.smart_bits
+SMART_SPECIFIC = 1
+SMART_MEASURABLE = 2
+SMART_ACHIEVABLE = 4
+SMART_RELEVANT = 8
+SMART_TIME_BOUND = 16
+SMART_ALL = 0x1F
+
+# Códigos de error de validación (banderas de bits que se combinan con OR)
+ERR_NO_DESC = 1
+ERR_NO_TITLE = 2
+ERR_PRIO = 4
+ERR_SMART = 8
+
+# Mensajes de error de validación, compartidos por todas las validaciones
+_ERR_DESC = "La descripción no puede estar vacía"
+_ERR_TITLE = "El título no puede estar vacío"
+_ERR_PRIO = "La prioridad debe estar entre 1 y 5"
+_ERR_SMART = "El requerimiento no cumple con todos los criterios SMART"
+
+# Mensajes ya armados para cada combinación de códigos de error (índice = códigos combinados)
+_ERROR_MESSAGES: Tuple[Tuple[str, ...], ...] = tuple(
+    tuple(message for flag, message in ((ERR_NO_DESC, _ERR_DESC), (ERR_NO_TITLE, _ERR_TITLE),
+                                        (ERR_PRIO, _ERR_PRIO), (ERR_SMART, _ERR_SMART))
+          if errors & flag)
+    for errors in range((ERR_NO_DESC | ERR_NO_TITLE | ERR_PRIO | ERR_SMART) + 1)
+)
+
+# Formato de fecha usado en el encabezado de los reportes
+_REPORT_TIME_FMT = "%Y-%m-%d %H:%M:%S"
+
+# ------------------------------
+# Clase _LabeledIntEnum
+# ------------------------------
+# Base común de los enumeradores del módulo: cada miembro es un entero (utilizable como índice)
+# y conserva su nombre legible en label. Los miembros se declaran como (valor, etiqueta).
+class _LabeledIntEnum(IntEnum):
+    label: str
+
+    def __new__(cls, value: int, label: str):
+        member = int.__new__(cls, value)
+        member._value_ = value
+        member.label = label
+        return member
 
 # ------------------------------
 # Clase RequirementType
 # ------------------------------
 # Esta clase define un enumerador para clasificar los tipos de requerimientos en un proyecto de software.
 # Se usa para categorizar cada requerimiento en funcional, no funcional, de negocio, técnico o de usuario.
-class RequirementType(Enum):
-    FUNCTIONAL = "Funcional"
-    NON_FUNCTIONAL = "No Funcional"
-    BUSINESS = "Negocio"
-    TECHNICAL = "Técnico"
-    USER = "Usuario"
+class RequirementType(_LabeledIntEnum):
+    FUNCTIONAL = 0, "Funcional"
+    NON_FUNCTIONAL = 1, "No Funcional"
+    BUSINESS = 2, "Negocio"
+    TECHNICAL = 3, "Técnico"
+    USER = 4, "Usuario"
 
 # ------------------------------
 # Clase VerificationStatus
 # ------------------------------
 # Define los estados de verificación de un requerimiento.
 # Un requerimiento puede estar pendiente, verificado o rechazado.
-class VerificationStatus(Enum):
-    PENDING = "Pendiente"
-    VERIFIED = "Verificado"
-    REJECTED = "Rechazado"
+class VerificationStatus(_LabeledIntEnum):
+    PENDING = 0, "Pendiente"
+    VERIFIED = 1, "Verificado"
+    REJECTED = 2, "Rechazado"
+
+# ------------------------------
+# Clase VerificationState
+# ------------------------------
+# Guarda el estado de la verificación de un requerimiento (estado, notas y fecha de modificación).
+# Es inmutable: cada verificación produce un estado nuevo en lugar de modificar el anterior.
+@dataclass(frozen=True, slots=True)
+class VerificationState:
+    status: VerificationStatus = VerificationStatus.PENDING  # Estado de verificación
+    notes: str = ""  # Notas registradas durante la verificación
+    last_modified: datetime = field(default_factory=datetime.now)  # Fecha del último cambio de estado
+
+# ------------------------------
+# Función _priority_in_range
+# ------------------------------
+# Única definición del rango válido de prioridades.
+# La usan tanto la validación individual como la columna de prioridades de RequirementsDocument.
+def _priority_in_range(priority: int) -> bool:
+    """Retorna True si la prioridad está entre 1 y 5."""
+    return 1 <= priority <= 5
+
+# ------------------------------
+# Función _validate_one
+# ------------------------------
+# Aplica las reglas de validación a los valores numéricos de un requerimiento.
+# Retorna los códigos de error combinados, de modo que puede usarse también sobre las columnas de un documento.
+def _validate_one(priority_ok: int, smart_bits: int, has_desc: int, has_title: int) -> int:
+    """Retorna la combinación de códigos ERR_* que corresponden a los valores recibidos (0 si es válido)."""
+    errors = 0
+
+    if not has_desc:
+        errors |= ERR_NO_DESC
+
+    if not has_title:
+        errors |= ERR_NO_TITLE
+
+    if not priority_ok:
+        errors |= ERR_PRIO
+
+    if smart_bits & SMART_ALL != SMART_ALL:
+        errors |= ERR_SMART
+
+    return errors
+
+# ------------------------------
+# Función _validate
+# ------------------------------
+# Traduce a mensajes los códigos de error de un requerimiento.
+# Como Requirement es inmutable, el resultado se memoriza según los valores de sus campos.
+@lru_cache(maxsize=1024)
+def _validate(description: str, title: str, priority: int, smart_bits: int) -> Tuple[str, ...]:
+    """Retorna los errores de validación correspondientes a los campos recibidos."""
+    return _ERROR_MESSAGES[_validate_one(_priority_in_range(priority), smart_bits, bool(description), bool(title))]
+
+# ------------------------------
+# Función _bulk_validate
+# ------------------------------
+# Valida en bloque las columnas de un RequirementsDocument escribiendo el resultado en un arreglo ya reservado.
+# Solo trabaja con enteros y delega en _validate_one, de modo que puede compilarse con @njit sin cambios.
+def _bulk_validate(priority_ok: array, smart_bits: array, has_desc: array, has_title: array, out: array) -> None:
+    """Escribe en out[i] los códigos de error del requerimiento i (0 si es válido)."""
+    for i in range(len(out)):
+        out[i] = _validate_one(priority_ok[i], smart_bits[i], has_desc[i], has_title[i])
 
 # ------------------------------
 # Clase Requirement
 # ------------------------------
 # Representa un requerimiento de software, con atributos como título, descripción, prioridad y criterios SMART.
-# Permite validar si cumple con las condiciones necesarias y gestionar su estado de verificación.
-@dataclass
+# Es inmutable: validarlo nunca lo modifica y verificarlo produce un nuevo VerificationState.
+@dataclass(frozen=True, slots=True)
 class Requirement:
     id: str  # Identificador único del requerimiento
     title: str  # Título breve del requerimiento
@@ -38,86 +148,178 @@ class Requirement:
     type: RequirementType  # Tipo de requerimiento
     priority: int  # Nivel de prioridad (1-5, donde 5 es la más alta)
 
-    # Características SMART (atributos opcionales con valores por defecto en False)
-    is_specific: bool = False
-    is_measurable: bool = False
-    is_achievable: bool = False
-    is_relevant: bool = False
-    is_time_bound: bool = False
+    # Características SMART empaquetadas en bits (combinación de constantes SMART_*, por defecto ninguna)
+    smart_bits: int = 0
 
     # Metadatos
-    created_date: datetime = datetime.now()
-    last_modified: datetime = datetime.now()
-    verification_status: VerificationStatus = VerificationStatus.PENDING
-    verification_notes: str = ""
+    created_date: datetime = field(default_factory=datetime.now)
 
     def validate(self) -> List[str]:
         """Verifica y valida si el requerimiento cumple con criterios de calidad y completitud."""
-        validation_errors = []
+        return list(_validate(self.description, self.title, self.priority, self.smart_bits))
+
+    @classmethod
+    def from_row(cls, row: Tuple[str, str, str, RequirementType, int, int, datetime]) -> "Requirement":
+        """Crea un requerimiento desde una fila (id, title, description, type, priority, smart_bits, created_date) sin pasar por __init__."""
+        req = cls.__new__(cls)
+        setattr_ = object.__setattr__
+        setattr_(req, "id", row[0])
+        setattr_(req, "title", row[1])
+        setattr_(req, "description", row[2])
+        setattr_(req, "type", row[3])
+        setattr_(req, "priority", row[4])
+        setattr_(req, "smart_bits", row[5])
+        setattr_(req, "created_date", row[6])
+        return req
 
-        if not self.description:
-            validation_errors.append("La descripción no puede estar vacía")
+    @property
+    def is_specific(self) -> bool:
+        """Indica si el requerimiento es específico."""
+        return bool(self.smart_bits & SMART_SPECIFIC)
 
-        if not self.title:
-            validation_errors.append("El título no puede estar vacío")
+    @property
+    def is_measurable(self) -> bool:
+        """Indica si el requerimiento es medible."""
+        return bool(self.smart_bits & SMART_MEASURABLE)
 
-        if not (1 <= self.priority <= 5):
-            validation_errors.append("La prioridad debe estar entre 1 y 5")
+    @property
+    def is_achievable(self) -> bool:
+        """Indica si el requerimiento es alcanzable."""
+        return bool(self.smart_bits & SMART_ACHIEVABLE)
 
-        if not all([self.is_specific, self.is_measurable, self.is_achievable,
-                    self.is_relevant, self.is_time_bound]):
-            validation_errors.append("El requerimiento no cumple con todos los criterios SMART")
+    @property
+    def is_relevant(self) -> bool:
+        """Indica si el requerimiento es relevante."""
+        return bool(self.smart_bits & SMART_RELEVANT)
 
-        return validation_errors
+    @property
+    def is_time_bound(self) -> bool:
+        """Indica si el requerimiento tiene un plazo definido."""
+        return bool(self.smart_bits & SMART_TIME_BOUND)
 
     def is_valid(self) -> bool:
         """Retorna True si el requerimiento es válido (no tiene errores de validación)."""
         return len(self.validate()) == 0
 
-    def verify(self, notes: str) -> None:
-        """Verifica el requerimiento, actualiza su estado y registra notas de verificación."""
-        if self.is_valid():
-            self.verification_status = VerificationStatus.VERIFIED
-            self.verification_notes = notes
-            self.last_modified = datetime.now()
+    def verify(self, notes: str, now: Optional[datetime] = None) -> VerificationState:
+        """Verifica el requerimiento y retorna su nuevo estado de verificación (now permite reutilizar la hora en lotes)."""
+        if now is None:
+            now = datetime.now()
+
+        errors = self.validate()
+        if not errors:
+            return VerificationState(VerificationStatus.VERIFIED, notes, now)
         else:
-            self.verification_status = VerificationStatus.REJECTED
-            self.verification_notes = f"Errores de validación: {', '.join(self.validate())}"
+            return VerificationState(VerificationStatus.REJECTED,
+                                     f"Errores de validación: {', '.join(errors)}", now)
 
 # ------------------------------
 # Clase RequirementsDocument
 # ------------------------------
 # Representa un documento que gestiona múltiples requerimientos de software en un proyecto.
-# Permite agregar, filtrar y generar reportes de los requerimientos almacenados.
+# Permite agregar, verificar, filtrar y generar reportes de los requerimientos almacenados.
 class RequirementsDocument:
     def __init__(self, project_name: str):
         """Inicializa un documento de requerimientos para un proyecto específico."""
         self.project_name = project_name
         self.requirements: List[Requirement] = []
+        self._verification_states: Dict[str, VerificationState] = {}
+        self._by_id: Dict[str, Requirement] = {}
         self.created_date = datetime.now()
 
+        # Índices mantenidos al insertar y verificar para no recorrer la lista completa.
+        # _status_counts (índice = VerificationStatus) solo es exacto porque los estados son privados,
+        # cambian únicamente en verify_requirement y add_requirement rechaza ids repetidos.
+        self._status_counts = [0] * len(VerificationStatus)
+        self._by_type: Dict[RequirementType, List[Requirement]] = {t: [] for t in RequirementType}
+
+        # Columnas compactas (una posición por requerimiento) para la validación en bloque
+        self._priority_ok = array('B')  # 1 si la prioridad está en rango (_priority_in_range)
+        self._smart = array('B')  # Bits SMART (smart_bits)
+        self._has_desc = array('B')  # 1 si tiene descripción
+        self._has_title = array('B')  # 1 si tiene título
+
     def add_requirement(self, requirement: Requirement) -> None:
-        """Añade un nuevo requerimiento al documento."""
+        """Añade un nuevo requerimiento al documento con estado de verificación pendiente."""
+        if requirement.id in self._by_id:
+            raise ValueError(f"Ya existe un requerimiento con id {requirement.id!r}")
+
+        # Se calculan antes de modificar el documento para que un error no lo deje a medias
+        bucket = self._by_type.get(requirement.type)
+        if bucket is None:
+            raise ValueError(f"Tipo de requerimiento desconocido: {requirement.type!r}")
+        priority_ok = _priority_in_range(requirement.priority)
+        smart_bits = requirement.smart_bits & SMART_ALL
+
         self.requirements.append(requirement)
+        self._by_id[requirement.id] = requirement
+        self._verification_states[requirement.id] = VerificationState()
+        self._status_counts[VerificationStatus.PENDING] += 1
+        bucket.append(requirement)
+
+        self._priority_ok.append(priority_ok)
+        self._smart.append(smart_bits)
+        self._has_desc.append(bool(requirement.description))
+        self._has_title.append(bool(requirement.title))
+
+    def verify_requirement(self, requirement: Requirement, notes: str,
+                           now: Optional[datetime] = None) -> VerificationState:
+        """Verifica un requerimiento del documento y registra su nuevo estado de verificación."""
+        if self._by_id.get(requirement.id) is not requirement:
+            raise ValueError(f"El requerimiento {requirement.id!r} no pertenece al documento")
+
+        state = requirement.verify(notes, now)
+        previous = self._verification_states[requirement.id]
+        self._verification_states[requirement.id] = state
+
+        self._status_counts[previous.status] -= 1
+        self._status_counts[state.status] += 1
+
+        return state
+
+    def get_state(self, req_id: str) -> VerificationState:
+        """Retorna el estado de verificación actual del requerimiento con el id indicado."""
+        if req_id not in self._verification_states:
+            raise ValueError(f"El requerimiento {req_id!r} no pertenece al documento")
+        return self._verification_states[req_id]
+
+    def bulk_validate(self) -> array:
+        """Retorna, en el orden de requirements, los códigos ERR_* de cada requerimiento (0 si es válido)."""
+        out = array('B', bytes(len(self._priority_ok)))
+        _bulk_validate(self._priority_ok, self._smart, self._has_desc, self._has_title, out)
+        return out
 
     def get_requirements_by_type(self, req_type: RequirementType) -> List[Requirement]:
-        """Filtra y retorna los requerimientos que pertenecen a un tipo específico."""
-        return [req for req in self.requirements if req.type == req_type]
+        """Retorna una copia de los requerimientos que pertenecen a un tipo específico."""
+        return list(self._by_type.get(req_type, ()))
 
-    def generate_report(self) -> str:
+    def generate_report(self, now: Optional[datetime] = None) -> str:
         """Genera un reporte con el estado actual de los requerimientos almacenados."""
-        report = f"Reporte de Requerimientos - {self.project_name}\n"
-        report += f"Fecha: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+        if now is None:
+            now = datetime.now()
+
+        parts = [f"Reporte de Requerimientos - {self.project_name}\n",
+                 f"Fecha: {now.strftime(_REPORT_TIME_FMT)}\n\n"]
 
         # Estadísticas generales
         total_reqs = len(self.requirements)
-        verified_reqs = len([r for r in self.requirements if r.verification_status == VerificationStatus.VERIFIED])
+        status_counts = self._status_counts
+        verified_reqs = status_counts[VerificationStatus.VERIFIED]
 
-        report += f"Total de requerimientos: {total_reqs}\n"
-        report += f"Requerimientos verificados: {verified_reqs}\n"
-        report += f"Porcentaje de completitud: {(verified_reqs / total_reqs) * 100 if total_reqs > 0 else 0}%\n"
+        parts.append(f"Total de requerimientos: {total_reqs}\n")
+        parts.append(f"Requerimientos verificados: {verified_reqs}\n")
+        parts.append(f"Porcentaje de completitud: {(verified_reqs / total_reqs) * 100 if total_reqs > 0 else 0}%\n")
 
-        return report
+        # Desglose por estado y por tipo (desde los índices)
+        parts.append("\nRequerimientos por estado:\n")
+        for status in VerificationStatus:
+            parts.append(f"  {status.label}: {status_counts[status]}\n")
+
+        parts.append("\nRequerimientos por tipo:\n")
+        for req_type, reqs in self._by_type.items():
+            parts.append(f"  {req_type.label}: {len(reqs)}\n")
+
+        return "".join(parts)
 
 # ------------------------------
 # Función main
@@ -134,19 +336,15 @@ def main():
         description="El sistema debe permitir registrar nuevos productos con código, nombre, precio y cantidad",
         type=RequirementType.FUNCTIONAL,
         priority=5,
-        is_specific=True,
-        is_measurable=True,
-        is_achievable=True,
-        is_relevant=True,
-        is_time_bound=True
+        smart_bits=SMART_ALL
     )
 
-    if req1.is_valid():
-        req1.verify("Requerimiento revisado y aprobado por el equipo técnico")
-
     # Agregarlo al documento
     doc.add_requirement(req1)
 
+    if req1.is_valid():
+        doc.verify_requirement(req1, "Requerimiento revisado y aprobado por el equipo técnico")
+
     # Generar y mostrar el reporte
     print(doc.generate_report())
 